@@ -6,6 +6,7 @@ database settings, and security parameters.
 """
 
 import os
+import functools
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -13,60 +14,107 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Accepted spellings for enabled boolean settings
+_BOOL_TRUE = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _envbool(name: str, default: str) -> bool:
+    """Parse a boolean environment variable."""
+    return os.environ.get(name, default).strip().lower() in _BOOL_TRUE
+
+
+# Static formatter definitions shared by every logging configuration
+_LOG_FORMATTERS = {
+    'standard': {
+        'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    },
+    'detailed': {
+        'format': '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+    }
+}
+
 
 class Config:
     """Configuration class for AmaCoach MCP server."""
     
+    __slots__ = (
+        'database_path', 'database_backup_enabled', 'database_backup_interval',
+        'server_host', 'server_port', 'debug_mode',
+        'oauth_client_id', 'oauth_client_secret', 'oauth_redirect_uri',
+        'jwt_secret_key', 'token_expiry_hours',
+        'rate_limit_enabled', 'rate_limit_requests_per_minute', 'rate_limit_burst_size',
+        'log_level', 'log_file', 'audit_log_enabled',
+        'default_rotation_weeks', 'max_active_plans', 'max_exercises_per_plan',
+        'max_difficulty_level', 'min_difficulty_level',
+        'database_connection_pool_size', 'query_timeout_seconds',
+        'railway_environment', 'railway_project_id', 'railway_service_id',
+        'health_check_interval', 'health_check_timeout', 'deep_healthcheck',
+        '_is_production'
+    )
+    
+    # Attributes that are safe to show in repr (no secrets)
+    _SAFE_REPR_FIELDS = (
+        'database_path', 'server_host', 'server_port', 'debug_mode',
+        'rate_limit_enabled', 'max_active_plans', 'default_rotation_weeks', 'log_level'
+    )
+    
     def __init__(self):
         """Initialize configuration from environment variables."""
+        # Bind the environment lookup once instead of going through os.getenv per field
+        g = os.environ.get
+        
         # Database configuration
-        self.database_path = os.getenv('DATABASE_PATH', 'amacoach.db')
-        self.database_backup_enabled = os.getenv('DATABASE_BACKUP_ENABLED', 'true').lower() == 'true'
-        self.database_backup_interval = int(os.getenv('DATABASE_BACKUP_INTERVAL', '3600'))  # seconds
+        self.database_path = g('DATABASE_PATH', 'amacoach.db')
+        self.database_backup_enabled = _envbool('DATABASE_BACKUP_ENABLED', 'true')
+        self.database_backup_interval = int(g('DATABASE_BACKUP_INTERVAL', '3600'))  # seconds
         
         # Server configuration
-        self.server_host = os.getenv('SERVER_HOST', '0.0.0.0')
-        self.server_port = int(os.getenv('PORT', os.getenv('SERVER_PORT', '8080')))
-        self.debug_mode = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+        self.server_host = g('SERVER_HOST', '0.0.0.0')
+        self.server_port = int(g('PORT', g('SERVER_PORT', '8080')))
+        self.debug_mode = _envbool('DEBUG_MODE', 'false')
         
         # Security configuration
-        self.oauth_client_id = os.getenv('OAUTH_CLIENT_ID')
-        self.oauth_client_secret = os.getenv('OAUTH_CLIENT_SECRET')
-        self.oauth_redirect_uri = os.getenv('OAUTH_REDIRECT_URI')
-        self.jwt_secret_key = os.getenv('JWT_SECRET_KEY')
-        self.token_expiry_hours = int(os.getenv('TOKEN_EXPIRY_HOURS', '24'))
+        self.oauth_client_id = g('OAUTH_CLIENT_ID')
+        self.oauth_client_secret = g('OAUTH_CLIENT_SECRET')
+        self.oauth_redirect_uri = g('OAUTH_REDIRECT_URI')
+        self.jwt_secret_key = g('JWT_SECRET_KEY')
+        self.token_expiry_hours = int(g('TOKEN_EXPIRY_HOURS', '24'))
         
         # Rate limiting configuration
-        self.rate_limit_enabled = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
-        self.rate_limit_requests_per_minute = int(os.getenv('RATE_LIMIT_REQUESTS_PER_MINUTE', '60'))
-        self.rate_limit_burst_size = int(os.getenv('RATE_LIMIT_BURST_SIZE', '10'))
+        self.rate_limit_enabled = _envbool('RATE_LIMIT_ENABLED', 'true')
+        self.rate_limit_requests_per_minute = int(g('RATE_LIMIT_REQUESTS_PER_MINUTE', '60'))
+        self.rate_limit_burst_size = int(g('RATE_LIMIT_BURST_SIZE', '10'))
         
         # Logging configuration
-        self.log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
-        self.log_file = os.getenv('LOG_FILE', 'amacoach.log')
-        self.audit_log_enabled = os.getenv('AUDIT_LOG_ENABLED', 'true').lower() == 'true'
+        self.log_level = g('LOG_LEVEL', 'INFO').upper()
+        self.log_file = g('LOG_FILE', 'amacoach.log')
+        self.audit_log_enabled = _envbool('AUDIT_LOG_ENABLED', 'true')
         
         # Workout plan configuration
-        self.default_rotation_weeks = int(os.getenv('DEFAULT_ROTATION_WEEKS', '6'))
-        self.max_active_plans = int(os.getenv('MAX_ACTIVE_PLANS', '3'))
-        self.max_exercises_per_plan = int(os.getenv('MAX_EXERCISES_PER_PLAN', '20'))
+        self.default_rotation_weeks = int(g('DEFAULT_ROTATION_WEEKS', '6'))
+        self.max_active_plans = int(g('MAX_ACTIVE_PLANS', '3'))
+        self.max_exercises_per_plan = int(g('MAX_EXERCISES_PER_PLAN', '20'))
         
         # Exercise configuration
-        self.max_difficulty_level = int(os.getenv('MAX_DIFFICULTY_LEVEL', '5'))
-        self.min_difficulty_level = int(os.getenv('MIN_DIFFICULTY_LEVEL', '1'))
+        self.max_difficulty_level = int(g('MAX_DIFFICULTY_LEVEL', '5'))
+        self.min_difficulty_level = int(g('MIN_DIFFICULTY_LEVEL', '1'))
         
         # Performance configuration
-        self.database_connection_pool_size = int(os.getenv('DATABASE_CONNECTION_POOL_SIZE', '10'))
-        self.query_timeout_seconds = int(os.getenv('QUERY_TIMEOUT_SECONDS', '30'))
+        self.database_connection_pool_size = int(g('DATABASE_CONNECTION_POOL_SIZE', '10'))
+        self.query_timeout_seconds = int(g('QUERY_TIMEOUT_SECONDS', '30'))
         
         # Railway-specific configuration
-        self.railway_environment = os.getenv('RAILWAY_ENVIRONMENT')
-        self.railway_project_id = os.getenv('RAILWAY_PROJECT_ID')
-        self.railway_service_id = os.getenv('RAILWAY_SERVICE_ID')
+        self.railway_environment = g('RAILWAY_ENVIRONMENT')
+        self.railway_project_id = g('RAILWAY_PROJECT_ID')
+        self.railway_service_id = g('RAILWAY_SERVICE_ID')
         
         # Health check configuration
-        self.health_check_interval = int(os.getenv('HEALTH_CHECK_INTERVAL', '30'))  # seconds
-        self.health_check_timeout = int(os.getenv('HEALTH_CHECK_TIMEOUT', '5'))    # seconds
+        self.health_check_interval = int(g('HEALTH_CHECK_INTERVAL', '30'))  # seconds
+        self.health_check_timeout = int(g('HEALTH_CHECK_TIMEOUT', '5'))    # seconds
+        self.deep_healthcheck = _envbool('DEEP_HEALTHCHECK', 'false')  # also probe writes (rolled back)
+        
+        # Derived settings never change after init, so compute them once
+        self._is_production = self.railway_environment == 'production' or not self.debug_mode
 
     def validate_config(self) -> bool:
         """Validate configuration and return True if valid."""
@@ -74,7 +122,7 @@ class Config:
         
         # Check required OAuth configuration in production
         # More lenient for Railway deployment health checks
-        if not self.debug_mode and not os.getenv('RAILWAY_ENVIRONMENT'):
+        if not self.debug_mode and not self.railway_environment:
             if not self.oauth_client_id or self.oauth_client_id == 'your_oauth_client_id':
                 errors.append("OAUTH_CLIENT_ID is required in production")
             if not self.oauth_client_secret or self.oauth_client_secret == 'your_oauth_client_secret':
@@ -94,14 +142,6 @@ class Config:
         if self.rate_limit_requests_per_minute < 1:
             errors.append("RATE_LIMIT_REQUESTS_PER_MINUTE must be >= 1")
         
-        # Validate database path is writable
-        db_dir = Path(self.database_path).parent
-        if not db_dir.exists():
-            try:
-                db_dir.mkdir(parents=True, exist_ok=True)
-            except Exception:
-                errors.append(f"Cannot create database directory: {db_dir}")
-        
         if errors:
             print("Configuration validation errors:")
             for error in errors:
@@ -110,44 +150,49 @@ class Config:
         
         return True
 
+    def ensure_dirs(self) -> bool:
+        """Create the database directory if needed. Call once at startup."""
+        db_dir = Path(self.database_path).parent
+        try:
+            db_dir.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            print(f"Cannot create database directory: {db_dir}")
+            return False
+        return True
+
     def get_database_url(self) -> str:
         """Get SQLite database URL."""
         return f"sqlite:///{self.database_path}"
 
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.railway_environment == 'production' or not self.debug_mode
+        return self._is_production
 
     def get_log_config(self) -> dict:
         """Get logging configuration dictionary."""
+        level = self.log_level
         return {
             'version': 1,
             'disable_existing_loggers': False,
-            'formatters': {
-                'standard': {
-                    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-                },
-                'detailed': {
-                    'format': '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-                }
-            },
+            # dictConfig consumes the nested dicts it is given, so hand out copies
+            'formatters': {name: dict(fmt) for name, fmt in _LOG_FORMATTERS.items()},
             'handlers': {
                 'console': {
                     'class': 'logging.StreamHandler',
-                    'level': self.log_level,
+                    'level': level,
                     'formatter': 'standard' if self.is_production() else 'detailed'
                 },
                 'file': {
                     'class': 'logging.FileHandler',
                     'filename': self.log_file,
-                    'level': self.log_level,
+                    'level': level,
                     'formatter': 'detailed'
                 }
             },
             'loggers': {
                 '': {  # root logger
                     'handlers': ['console', 'file'] if self.log_file else ['console'],
-                    'level': self.log_level,
+                    'level': level,
                     'propagate': False
                 }
             }
@@ -155,38 +200,37 @@ class Config:
 
     def __repr__(self) -> str:
         """String representation of configuration (without sensitive data)."""
-        safe_config = {
-            'database_path': self.database_path,
-            'server_host': self.server_host,
-            'server_port': self.server_port,
-            'debug_mode': self.debug_mode,
-            'rate_limit_enabled': self.rate_limit_enabled,
-            'max_active_plans': self.max_active_plans,
-            'default_rotation_weeks': self.default_rotation_weeks,
-            'log_level': self.log_level,
-            'is_production': self.is_production()
-        }
-        return f"Config({safe_config})"
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._SAFE_REPR_FIELDS)
+        return f"Config({fields}, is_production={self.is_production()!r})"
+
 
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the global configuration instance, building it on first use."""
+    return Config()
 
-# Global configuration instance
-config = Config()
+
+def __getattr__(name: str):
+    """Resolve the legacy module-level `config` attribute lazily."""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Configuration validation constants
-VALID_RECORD_TYPES = {'weight', 'reps', 'time', 'distance'}
-VALID_LOG_LEVELS = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
-SUPPORTED_MUSCLE_GROUPS = {
+VALID_RECORD_TYPES = frozenset({'weight', 'reps', 'time', 'distance'})
+VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+SUPPORTED_MUSCLE_GROUPS = frozenset({
     'chest', 'back', 'shoulders', 'biceps', 'triceps', 'forearms',
     'abs', 'obliques', 'lower_back', 'quadriceps', 'hamstrings', 
     'calves', 'glutes', 'cardio', 'full_body'
-}
-SUPPORTED_EQUIPMENT = {
+})
+SUPPORTED_EQUIPMENT = frozenset({
     'bodyweight', 'dumbbells', 'barbell', 'resistance_bands', 
     'pull_up_bar', 'kettlebells', 'cable_machine', 'smith_machine',
     'bench', 'stability_ball', 'medicine_ball', 'foam_roller',
     'cardio_machine', 'yoga_mat'
-}
+})
 
 
 def get_environment_template() -> str:
@@ -236,6 +280,7 @@ QUERY_TIMEOUT_SECONDS=30
 # Health Checks
 HEALTH_CHECK_INTERVAL=30
 HEALTH_CHECK_TIMEOUT=5
+DEEP_HEALTHCHECK=false
 
 # Railway Configuration (Auto-populated by Railway)
 # RAILWAY_ENVIRONMENT=
@@ -8,8 +8,11 @@ with proper security measures including parameterized queries and user data isol
 import sqlite3
 import os
 import json
+import queue
+import threading
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union, Iterator
+from typing import List, Optional, Dict, Any, Set, Tuple, Union, Iterator
 from contextlib import contextmanager
 
 from models import (
@@ -29,38 +32,307 @@ class UserPermissionError(Exception):
     pass
 
 
+STATEMENT_CACHE_SIZE = 128
+
+# Bump SCHEMA_VERSION whenever init_schema changes so existing databases
+# rerun the (idempotent) bootstrap once
+SCHEMA_VERSION = 2
+APPLICATION_ID = 0x414D4143  # "AMAC"
+
+# Entries kept in each per-user read cache before it is reset
+USER_CACHE_SIZE = 1024
+
+# Timestamps are stored as ISO-8601 text; datetime.fromisoformat is already
+# the C-level parser, so bind it once for the per-row readers
+parse_timestamp = datetime.fromisoformat
+
+# SQL statements are kept as module constants so identical text is reused
+# on every call and served from the connection's prepared-statement cache
+SQL_INSERT_USER = """
+    INSERT INTO users (user_id, name, created_date, rotation_weeks, current_cycle_number)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (user_id) DO NOTHING
+    RETURNING user_id, name, created_date, rotation_weeks, last_rotation_date, current_cycle_number
+"""
+SQL_GET_USER = "SELECT * FROM users WHERE user_id = ?"
+SQL_GET_USER_CYCLE = "SELECT current_cycle_number FROM users WHERE user_id = ?"
+SQL_UPDATE_USER_ROTATION = """
+    UPDATE users
+    SET last_rotation_date = ?, current_cycle_number = current_cycle_number + 1
+    WHERE user_id = ?
+"""
+SQL_INSERT_EXERCISE = """
+    INSERT INTO exercises (name, description, muscle_groups, equipment_needed,
+                           difficulty_level, instructions, created_date, created_by_user_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING exercise_id
+"""
+SQL_GET_EXERCISE = "SELECT * FROM exercises WHERE exercise_id = ?"
+# IDs are bound as one JSON array so any number of them shares a single cached statement
+SQL_EXISTING_EXERCISE_IDS = "SELECT exercise_id FROM exercises WHERE exercise_id IN (SELECT value FROM json_each(?))"
+SQL_SELECT_EXERCISES = """
+    SELECT exercise_id, name, description, muscle_groups, equipment_needed,
+           difficulty_level, instructions, created_date, created_by_user_id
+    FROM exercises
+"""
+# One JSON object per exercise, with the same keys and order as Exercise.to_dict().
+# Tag columns that are not a valid JSON array become [] like _tag_list does. The
+# objects are joined into an array in Python: json_group_array would follow the
+# subquery's ORDER BY only by accident, and SQLite 3.40 has no ordered aggregates.
+# json_type rejects malformed text, so CASE checks json_valid first
+SQL_SELECT_EXERCISES_JSON = """
+    SELECT json_object(
+               'exercise_id', exercise_id,
+               'name', name,
+               'description', description,
+               'muscle_groups', CASE WHEN NOT json_valid(muscle_groups) THEN json_array()
+                                     WHEN json_type(muscle_groups) = 'array' THEN json(muscle_groups)
+                                     ELSE json_array() END,
+               'equipment_needed', CASE WHEN NOT json_valid(equipment_needed) THEN json_array()
+                                        WHEN json_type(equipment_needed) = 'array' THEN json(equipment_needed)
+                                        ELSE json_array() END,
+               'difficulty_level', difficulty_level,
+               'instructions', instructions,
+               'created_date', created_date,
+               'created_by_user_id', created_by_user_id
+           )
+    FROM exercises
+"""
+SQL_INSERT_EXERCISE_MUSCLE_GROUP = "INSERT OR IGNORE INTO exercise_muscle_groups (exercise_id, muscle_group) VALUES (?, ?)"
+SQL_INSERT_EXERCISE_EQUIPMENT = "INSERT OR IGNORE INTO exercise_equipment (exercise_id, equipment) VALUES (?, ?)"
+SQL_FILTER_MUSCLE_GROUP = "exercise_id IN (SELECT exercise_id FROM exercise_muscle_groups WHERE muscle_group = ?)"
+SQL_FILTER_EQUIPMENT = "exercise_id IN (SELECT exercise_id FROM exercise_equipment WHERE equipment = ?)"
+# "Any of" filters bind their values as one JSON array, like SQL_EXISTING_EXERCISE_IDS
+SQL_FILTER_ANY_MUSCLE_GROUP = "exercise_id IN (SELECT exercise_id FROM exercise_muscle_groups WHERE muscle_group IN (SELECT value FROM json_each(?)))"
+SQL_FILTER_ANY_EQUIPMENT = "exercise_id IN (SELECT exercise_id FROM exercise_equipment WHERE equipment IN (SELECT value FROM json_each(?)))"
+SQL_DEACTIVATE_PLANS = """
+    UPDATE workout_plans
+    SET is_active = 0
+    WHERE user_id = ? AND is_active = 1
+"""
+SQL_INSERT_PLAN = """
+    INSERT INTO workout_plans (user_id, plan_name, cycle_number, is_active, created_date, notes)
+    VALUES (?, ?, ?, ?, ?, ?)
+    RETURNING plan_id
+"""
+SQL_INSERT_PLANNED_EXERCISE = """
+    INSERT INTO planned_exercises (plan_id, exercise_id, sets, reps, weight, duration, notes, order_in_plan)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_GET_PLAN_WITH_EXERCISES = """
+    SELECT wp.plan_id, wp.user_id, wp.plan_name, wp.cycle_number, wp.is_active,
+           wp.created_date, wp.notes,
+           pe.planned_exercise_id, pe.exercise_id, e.name, e.description,
+           e.muscle_groups, e.equipment_needed, e.difficulty_level,
+           pe.sets, pe.reps, pe.weight, pe.duration, pe.notes AS exercise_notes,
+           pe.order_in_plan
+    FROM workout_plans wp
+    LEFT JOIN planned_exercises pe ON pe.plan_id = wp.plan_id
+    LEFT JOIN exercises e ON e.exercise_id = pe.exercise_id
+    WHERE wp.plan_id = ? AND wp.user_id = ?
+    ORDER BY pe.order_in_plan
+"""
+SQL_LIST_ACTIVE_PLANS = """
+    SELECT * FROM workout_plans
+    WHERE user_id = ? AND is_active = 1
+    ORDER BY created_date DESC
+"""
+SQL_INSERT_PERSONAL_RECORD = """
+    INSERT INTO personal_records (user_id, exercise_name, record_type, value, unit, date_achieved, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    RETURNING record_id
+"""
+SQL_SELECT_PERSONAL_RECORDS = """
+    SELECT record_id, user_id, exercise_name, record_type, value, unit, date_achieved, notes
+    FROM personal_records
+    WHERE user_id = ?
+"""
+SQL_COUNT_ACTIVE_PLANS = """
+    SELECT COUNT(*) as count FROM workout_plans
+    WHERE user_id = ? AND is_active = 1
+"""
+
+
+def _tag_list(text: Optional[str]) -> list:
+    """Decode a JSON tag column, returning an empty list for bad or non-list data."""
+    data = deserialize_json_field(text)
+    return data if isinstance(data, list) else []
+
+
 class Database:
     """SQLite database manager with security and constraint enforcement."""
     
-    def __init__(self, db_path: str = "amacoach.db"):
+    def __init__(self, db_path: str = "amacoach.db", reader_pool_size: int = 4):
         """Initialize database connection and ensure schema exists."""
         self.db_path = db_path
+        # One long-lived writer connection is reused for every write; the lock
+        # serializes write transactions across threads and allows nested use
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._writer_thread: Optional[int] = None
+        # Reader connections run in parallel under WAL and are checked out
+        # from a bounded pool; in-memory databases cannot be shared, so they
+        # read through the writer instead
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        # Every reader ever opened, checked out or not, so close() reaches all of them
+        self._reader_connections: List[sqlite3.Connection] = []
+        self._reader_lock = threading.Lock()
+        self._reader_pool_size = 0 if db_path == ":memory:" else max(reader_pool_size, 0)
+        # Small per-user caches for hot control-flow reads, invalidated by the
+        # write methods below; the generation counter keeps a read that raced
+        # with a write from caching stale data
+        self._user_cache: Dict[str, User] = {}
+        self._active_count_cache: Dict[str, int] = {}
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
         self.init_schema()
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with foreign key constraints enabled."""
-        conn = sqlite3.connect(self.db_path)
+        """Get the shared writer connection, opening it on first use."""
+        if self._conn is None:
+            conn = self._make_connection()
+            conn.execute("PRAGMA journal_mode = WAL")
+            self._conn = conn
+        return self._conn
+
+    def _make_connection(self) -> sqlite3.Connection:
+        """Open a new connection with the standard settings applied."""
+        # isolation_level=None disables sqlite3's implicit transaction
+        # handling; write transactions are opened explicitly in get_cursor
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        self._init_connection(conn)
+        return conn
+
+    def _init_connection(self, conn: sqlite3.Connection) -> None:
+        """Apply per-connection settings tuned for a read-mostly workload."""
         conn.execute("PRAGMA foreign_keys = ON")
+        # In WAL mode NORMAL only syncs at checkpoints: the file stays consistent,
+        # but a power loss can drop the most recent commits. That trade is fine
+        # for workout logs in exchange for no fsync per write
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -64000")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB memory map
         conn.row_factory = sqlite3.Row
-        return conn
+
+    def close(self) -> None:
+        """Close the writer and every reader connection, including checked-out ones."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            with self._reader_lock:
+                for conn in self._reader_connections:
+                    conn.close()
+                self._reader_connections.clear()
+                while True:
+                    try:
+                        self._readers.get_nowait()
+                    except queue.Empty:
+                        break
 
     @contextmanager
     def get_cursor(self) -> Iterator[sqlite3.Cursor]:
-        """Context manager for database transactions."""
-        conn = self.get_connection()
+        """Context manager for write transactions on the writer connection.
+
+        Nested calls join the enclosing transaction, which is committed or
+        rolled back only by the outermost block.
+        """
+        with self._lock:
+            conn = self.get_connection()
+            self._depth += 1
+            self._writer_thread = threading.get_ident()
+            try:
+                if self._depth == 1:
+                    # Take the write lock up front instead of upgrading a
+                    # deferred transaction on its first write
+                    conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.cursor()
+                yield cursor
+                if self._depth == 1:
+                    conn.execute("COMMIT")
+            except Exception as e:
+                if self._depth == 1 and conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                # Errors already wrapped by a nested block pass through unchanged
+                if isinstance(e, DatabaseError):
+                    raise
+                raise DatabaseError(f"Database operation failed: {str(e)}")
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._writer_thread = None
+
+    @contextmanager
+    def get_reader_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Context manager for read-only queries on a pooled reader connection."""
+        if self._reader_pool_size == 0 or self._writer_thread == threading.get_ident():
+            # Reads inside an open write transaction must see its changes
+            with self.get_cursor() as cursor:
+                yield cursor
+            return
+
+        conn = self._checkout_reader()
         try:
-            cursor = conn.cursor()
-            yield cursor
-            conn.commit()
+            yield conn.cursor()
+        except DatabaseError:
+            raise
         except Exception as e:
-            conn.rollback()
             raise DatabaseError(f"Database operation failed: {str(e)}")
         finally:
-            conn.close()
+            # A reader closed by close() while checked out is not returned to the pool
+            if conn in self._reader_connections:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._readers.put(conn)
+
+    def _checkout_reader(self) -> sqlite3.Connection:
+        """Take a reader from the pool, opening one if the pool is not full."""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._reader_lock:
+            if len(self._reader_connections) < self._reader_pool_size:
+                conn = self._make_connection()
+                self._reader_connections.append(conn)
+                return conn
+        return self._readers.get()
+
+    @contextmanager
+    def _user_write_cursor(self, user_id: str) -> Iterator[sqlite3.Cursor]:
+        """Write transaction that invalidates the user's cached reads once it ends."""
+        try:
+            with self.get_cursor() as cursor:
+                yield cursor
+        finally:
+            with self._cache_lock:
+                self._cache_generation += 1
+                self._user_cache.pop(user_id, None)
+                self._active_count_cache.pop(user_id, None)
+
+    def _cache_store(self, cache: Dict[str, Any], user_id: str, value: Any, generation: int) -> None:
+        """Cache a value read at `generation` unless a write has happened since."""
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                if len(cache) >= USER_CACHE_SIZE:
+                    cache.clear()
+                cache[user_id] = value
 
     def init_schema(self) -> None:
-        """Initialize database schema with all tables and constraints."""
+        """Initialize database schema with all tables and constraints.
+
+        Skipped entirely when the database already reports the current
+        SCHEMA_VERSION, so reopening an existing database does no DDL.
+        """
         with self.get_cursor() as cursor:
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] >= SCHEMA_VERSION:
+                return
+
             # Create User table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS users (
@@ -105,7 +377,10 @@ class Database:
             """)
 
             # Note: Removed hard 3-plan constraint trigger to allow unlimited active plans
-            # Plan lifecycle management is now handled in application logic
+            # Plan lifecycle management is now handled in application logic.
+            # Drop the trigger from databases created before it was removed so
+            # plan inserts no longer run its per-row COUNT(*)
+            cursor.execute("DROP TRIGGER IF EXISTS enforce_max_active_plans")
 
             # Create PlannedExercise table
             cursor.execute("""
@@ -140,14 +415,55 @@ class Database:
                 )
             """)
 
+            # Create normalized tag tables so muscle group / equipment filters can
+            # use an index instead of substring-matching the JSON columns
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS exercise_muscle_groups (
+                    exercise_id INTEGER NOT NULL,
+                    muscle_group TEXT NOT NULL COLLATE NOCASE,
+                    PRIMARY KEY (exercise_id, muscle_group),
+                    FOREIGN KEY (exercise_id) REFERENCES exercises (exercise_id) ON DELETE CASCADE
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS exercise_equipment (
+                    exercise_id INTEGER NOT NULL,
+                    equipment TEXT NOT NULL COLLATE NOCASE,
+                    PRIMARY KEY (exercise_id, equipment),
+                    FOREIGN KEY (exercise_id) REFERENCES exercises (exercise_id) ON DELETE CASCADE
+                )
+            """)
+
+            # Backfill tag tables for exercises created before they existed; like
+            # _tag_list, only JSON arrays count (json_type needs valid JSON first)
+            cursor.execute("""
+                INSERT OR IGNORE INTO exercise_muscle_groups (exercise_id, muscle_group)
+                SELECT e.exercise_id, j.value FROM exercises e, json_each(e.muscle_groups) j
+                WHERE CASE WHEN json_valid(e.muscle_groups) THEN json_type(e.muscle_groups) = 'array' END AND j.type = 'text'
+            """)
+            cursor.execute("""
+                INSERT OR IGNORE INTO exercise_equipment (exercise_id, equipment)
+                SELECT e.exercise_id, j.value FROM exercises e, json_each(e.equipment_needed) j
+                WHERE CASE WHEN json_valid(e.equipment_needed) THEN json_type(e.equipment_needed) = 'array' END AND j.type = 'text'
+            """)
+
             # Create indexes for performance
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_exercises_name ON exercises (name)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_exercises_muscle_groups ON exercises (muscle_groups)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_workout_plans_user_active ON workout_plans (user_id, is_active)")
+            cursor.execute("DROP INDEX IF EXISTS idx_exercises_name")  # duplicates the UNIQUE(name) index
+            cursor.execute("DROP INDEX IF EXISTS idx_exercises_muscle_groups")  # unusable for tag filters
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_exercise_muscle_groups_group ON exercise_muscle_groups (muscle_group, exercise_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_exercise_equipment_equipment ON exercise_equipment (equipment, exercise_id)")
+            # Index order matches the active-plan listing so its ORDER BY needs no sort
+            cursor.execute("DROP INDEX IF EXISTS idx_workout_plans_user_active")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_workout_plans_user_active_date ON workout_plans (user_id, is_active, created_date DESC)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_planned_exercises_plan ON planned_exercises (plan_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_personal_records_user ON personal_records (user_id)")
+            cursor.execute("DROP INDEX IF EXISTS idx_personal_records_user")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_personal_records_user_date ON personal_records (user_id, date_achieved DESC)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_personal_records_exercise ON personal_records (user_id, exercise_name)")
 
+            # Mark the file as an AmaCoach database at the current schema version
+            cursor.execute(f"PRAGMA application_id = {APPLICATION_ID}")
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     def _validate_user_access(self, cursor, user_id: str, table: str, record_user_id: Optional[str] = None) -> None:
         """Validate user can only access their own data."""
         if record_user_id and record_user_id != user_id:
@@ -156,57 +472,54 @@ class Database:
     # User operations
     def create_user(self, user_id: str, name: str) -> User:
         """Create a new user if they don't exist."""
-        with self.get_cursor() as cursor:
-            # Check if user already exists
-            cursor.execute("SELECT user_id FROM users WHERE user_id = ?", (user_id,))
-            if cursor.fetchone():
+        with self._user_write_cursor(user_id) as cursor:
+            # Insert and read back in one statement; an existing user yields no row
+            cursor.execute(SQL_INSERT_USER, (user_id, name, datetime.now().isoformat(), 6, 1))
+            row = cursor.fetchone()
+            if row is None:
                 # User exists, return existing user
-                existing_user = self.get_user(user_id)
-                if existing_user is None:
+                cursor.execute(SQL_GET_USER, (user_id,))
+                row = cursor.fetchone()
+                if row is None:
                     raise DatabaseError(f"User {user_id} exists in database but could not be retrieved")
-                return existing_user
+            return self._row_to_user(row)
 
-            # Create new user
-            created_date = datetime.now()
-            cursor.execute("""
-                INSERT INTO users (user_id, name, created_date, rotation_weeks, current_cycle_number)
-                VALUES (?, ?, ?, ?, ?)
-            """, (user_id, name, created_date.isoformat(), 6, 1))
+    def get_user(self, user_id: str) -> Optional[User]:
+        """Get user by user_id.
 
-            return User(
-                user_id=user_id,
-                name=name,
-                created_date=created_date,
-                rotation_weeks=6,
-                current_cycle_number=1
-            )
+        Callers get their own copy, so changing it cannot alter the cached user.
+        """
+        user = self._user_cache.get(user_id)
+        if user is not None:
+            return replace(user)
 
-    def get_user(self, user_id: str) -> Optional[User]:
-        """Get user by user_id."""
-        with self.get_cursor() as cursor:
-            cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
+        generation = self._cache_generation
+        with self.get_reader_cursor() as cursor:
+            cursor.execute(SQL_GET_USER, (user_id,))
             row = cursor.fetchone()
             if not row:
                 return None
 
-            return User(
-                user_id=row['user_id'],
-                name=row['name'],
-                created_date=datetime.fromisoformat(row['created_date']),
-                rotation_weeks=row['rotation_weeks'],
-                last_rotation_date=datetime.fromisoformat(row['last_rotation_date']) if row['last_rotation_date'] else None,
-                current_cycle_number=row['current_cycle_number']
-            )
+            user = self._row_to_user(row)
+        self._cache_store(self._user_cache, user_id, user, generation)
+        return replace(user)
+
+    def _row_to_user(self, row: sqlite3.Row) -> User:
+        """Build a User from a users table row."""
+        return User(
+            user_id=row['user_id'],
+            name=row['name'],
+            created_date=parse_timestamp(row['created_date']),
+            rotation_weeks=row['rotation_weeks'],
+            last_rotation_date=parse_timestamp(row['last_rotation_date']) if row['last_rotation_date'] else None,
+            current_cycle_number=row['current_cycle_number']
+        )
 
     def update_user_rotation(self, user_id: str) -> None:
         """Update user's rotation date and increment cycle number."""
-        with self.get_cursor() as cursor:
+        with self._user_write_cursor(user_id) as cursor:
             now = datetime.now()
-            cursor.execute("""
-                UPDATE users 
-                SET last_rotation_date = ?, current_cycle_number = current_cycle_number + 1
-                WHERE user_id = ?
-            """, (now.isoformat(), user_id))
+            cursor.execute(SQL_UPDATE_USER_ROTATION, (now.isoformat(), user_id))
 
     # Exercise operations
     def create_exercise(self, name: str, description: str, muscle_groups: List[str], 
@@ -218,20 +531,21 @@ class Database:
 
         with self.get_cursor() as cursor:
             created_date = datetime.now()
-            cursor.execute("""
-                INSERT INTO exercises (name, description, muscle_groups, equipment_needed, 
-                                     difficulty_level, instructions, created_date, created_by_user_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(SQL_INSERT_EXERCISE, (
                 name, description, 
                 serialize_json_field(muscle_groups),
                 serialize_json_field(equipment_needed),
                 difficulty_level, instructions, created_date.isoformat(), created_by_user_id
             ))
 
-            exercise_id = cursor.lastrowid
-            if exercise_id is None:
+            row = cursor.fetchone()
+            if row is None:
                 raise DatabaseError("Failed to create exercise: no row ID returned")
+            exercise_id = row[0]
+            cursor.executemany(SQL_INSERT_EXERCISE_MUSCLE_GROUP,
+                               [(exercise_id, group) for group in muscle_groups])
+            cursor.executemany(SQL_INSERT_EXERCISE_EQUIPMENT,
+                               [(exercise_id, item) for item in equipment_needed])
             return Exercise(
                 exercise_id=exercise_id,
                 name=name,
@@ -248,80 +562,147 @@ class Database:
                       equipment: Optional[str] = None, 
                       difficulty: Optional[int] = None) -> List[Exercise]:
         """List exercises with optional filters."""
-        with self.get_cursor() as cursor:
-            query = "SELECT * FROM exercises"
-            params = []
-            conditions = []
-
-            if muscle_group:
-                conditions.append("muscle_groups LIKE ?")
-                params.append(f'%"{muscle_group}"%')
-
-            if equipment:
-                conditions.append("equipment_needed LIKE ?")
-                params.append(f'%"{equipment}"%')
-
-            if difficulty:
-                conditions.append("difficulty_level = ?")
-                params.append(difficulty)
-
-            if conditions:
-                query += " WHERE " + " AND ".join(conditions)
-
-            query += " ORDER BY name"
-
+        return list(self.iter_exercises(muscle_group, equipment, difficulty))
+
+    def list_exercise_dicts(self, muscle_group: Optional[str] = None,
+                            equipment: Optional[str] = None,
+                            difficulty: Optional[int] = None, *,
+                            muscle_any: Optional[List[str]] = None,
+                            equipment_any: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """List exercises as dicts shaped like Exercise.to_dict(), skipping the models.
+
+        muscle_any / equipment_any keep exercises tagged with at least one of the
+        given values. Stored timestamps are already ISO strings, so they are
+        passed through as-is.
+        """
+        query, params = self._exercise_query(muscle_group, equipment, difficulty,
+                                             muscle_any, equipment_any)
+        with self.get_reader_cursor() as cursor:
+            cursor.row_factory = None
             cursor.execute(query, params)
-            exercises = []
-            for row in cursor.fetchall():
-                # Deserialize JSON fields with type assertion for lists
-                muscle_groups_data = deserialize_json_field(row['muscle_groups'])
-                equipment_data = deserialize_json_field(row['equipment_needed'])
-                
-                # Ensure they're lists (fallback to empty list if not)
-                muscle_groups = muscle_groups_data if isinstance(muscle_groups_data, list) else []
-                equipment_needed = equipment_data if isinstance(equipment_data, list) else []
-                
-                exercises.append(Exercise(
-                    exercise_id=row['exercise_id'],
-                    name=row['name'],
-                    description=row['description'],
-                    muscle_groups=muscle_groups,
-                    equipment_needed=equipment_needed,
-                    difficulty_level=row['difficulty_level'],
-                    instructions=row['instructions'],
-                    created_date=datetime.fromisoformat(row['created_date']),
-                    created_by_user_id=row['created_by_user_id']
-                ))
-            return exercises
+            return [
+                {
+                    'exercise_id': exercise_id,
+                    'name': name,
+                    'description': description,
+                    'muscle_groups': _tag_list(muscle_groups),
+                    'equipment_needed': _tag_list(equipment_needed),
+                    'difficulty_level': difficulty_level,
+                    'instructions': instructions,
+                    'created_date': created_date,
+                    'created_by_user_id': created_by_user_id
+                }
+                for (exercise_id, name, description, muscle_groups, equipment_needed,
+                     difficulty_level, instructions, created_date, created_by_user_id) in cursor
+            ]
+
+    def list_exercises_json(self, muscle_group: Optional[str] = None,
+                            equipment: Optional[str] = None,
+                            difficulty: Optional[int] = None) -> Tuple[str, int]:
+        """List exercises as a serialized JSON array built by SQLite, plus the row count.
+
+        The array matches json.dumps(list_exercise_dicts(...)) in content, but each
+        row arrives as one JSON string instead of a dict to encode.
+        """
+        query, params = self._exercise_query(muscle_group, equipment, difficulty,
+                                             select=SQL_SELECT_EXERCISES_JSON)
+        with self.get_reader_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            objects = [row[0] for row in cursor]
+            return '[' + ','.join(objects) + ']', len(objects)
+
+    def _exercise_query(self, muscle_group: Optional[str], equipment: Optional[str],
+                        difficulty: Optional[int], muscle_any: Optional[List[str]] = None,
+                        equipment_any: Optional[List[str]] = None,
+                        select: str = SQL_SELECT_EXERCISES) -> Tuple[str, List[Any]]:
+        """Build the filtered exercise listing query and its parameters."""
+        query = select
+        params = []
+        conditions = []
+
+        if muscle_group:
+            conditions.append(SQL_FILTER_MUSCLE_GROUP)
+            params.append(muscle_group)
+
+        if equipment:
+            conditions.append(SQL_FILTER_EQUIPMENT)
+            params.append(equipment)
+
+        if muscle_any:
+            conditions.append(SQL_FILTER_ANY_MUSCLE_GROUP)
+            params.append(serialize_json_field(list(muscle_any)))
+
+        if equipment_any:
+            conditions.append(SQL_FILTER_ANY_EQUIPMENT)
+            params.append(serialize_json_field(list(equipment_any)))
+
+        if difficulty:
+            conditions.append("difficulty_level = ?")
+            params.append(difficulty)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY name"
+        return query, params
+
+    def iter_exercises(self, muscle_group: Optional[str] = None,
+                       equipment: Optional[str] = None,
+                       difficulty: Optional[int] = None) -> Iterator[Exercise]:
+        """Yield exercises with optional filters as rows are read.
+
+        The reader connection stays checked out until the generator is
+        exhausted or closed, so consume or close it promptly.
+        """
+        query, params = self._exercise_query(muscle_group, equipment, difficulty)
+        with self.get_reader_cursor() as cursor:
+            # Plain tuples in a fixed column order avoid per-column Row lookups
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            for (exercise_id, name, description, muscle_groups, equipment_needed,
+                 difficulty_level, instructions, created_date, created_by_user_id) in cursor:
+                yield Exercise(
+                    exercise_id=exercise_id,
+                    name=name,
+                    description=description,
+                    muscle_groups=_tag_list(muscle_groups),
+                    equipment_needed=_tag_list(equipment_needed),
+                    difficulty_level=difficulty_level,
+                    instructions=instructions,
+                    created_date=parse_timestamp(created_date),
+                    created_by_user_id=created_by_user_id
+                )
 
     def get_exercise_by_id(self, exercise_id: int) -> Optional[Exercise]:
         """Get exercise by ID."""
-        with self.get_cursor() as cursor:
-            cursor.execute("SELECT * FROM exercises WHERE exercise_id = ?", (exercise_id,))
+        with self.get_reader_cursor() as cursor:
+            cursor.execute(SQL_GET_EXERCISE, (exercise_id,))
             row = cursor.fetchone()
             if not row:
                 return None
 
-            # Deserialize JSON fields with type assertion for lists
-            muscle_groups_data = deserialize_json_field(row['muscle_groups'])
-            equipment_data = deserialize_json_field(row['equipment_needed'])
-            
-            # Ensure they're lists (fallback to empty list if not)
-            muscle_groups = muscle_groups_data if isinstance(muscle_groups_data, list) else []
-            equipment_needed = equipment_data if isinstance(equipment_data, list) else []
-            
             return Exercise(
                 exercise_id=row['exercise_id'],
                 name=row['name'],
                 description=row['description'],
-                muscle_groups=muscle_groups,
-                equipment_needed=equipment_needed,
+                muscle_groups=_tag_list(row['muscle_groups']),
+                equipment_needed=_tag_list(row['equipment_needed']),
                 difficulty_level=row['difficulty_level'],
                 instructions=row['instructions'],
-                created_date=datetime.fromisoformat(row['created_date']),
+                created_date=parse_timestamp(row['created_date']),
                 created_by_user_id=row['created_by_user_id']
             )
 
+    def exercise_ids_exist(self, exercise_ids: List[int]) -> Set[int]:
+        """Return the subset of exercise_ids that exist, using one query."""
+        if not exercise_ids:
+            return set()
+        with self.get_reader_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute(SQL_EXISTING_EXERCISE_IDS, (serialize_json_field(list(exercise_ids)),))
+            return {row[0] for row in cursor}
+
     # Workout Plan operations
     def save_workout_plan(self, user_id: str, plan_name: str, 
                          exercises_list: List[Dict], notes: Optional[str] = None,
@@ -337,50 +718,45 @@ class Database:
                           When the first plan of a set is created, all existing active plans
                           will be marked inactive to maintain clean plan lifecycle.
         """
-        with self.get_cursor() as cursor:
+        with self._user_write_cursor(user_id) as cursor:
             # Get user's current cycle number
-            user = self.get_user(user_id)
-            if not user:
+            cursor.execute(SQL_GET_USER_CYCLE, (user_id,))
+            row = cursor.fetchone()
+            if row is None:
                 raise ValueError(f"User {user_id} not found")
+            cycle_number = row[0]
 
             created_date = datetime.now()
             
             # If this is the first plan of a Claude-generated 3-plan set,
             # mark all existing active plans as inactive
             if create_as_set:
-                cursor.execute("""
-                    UPDATE workout_plans 
-                    SET is_active = 0 
-                    WHERE user_id = ? AND is_active = 1
-                """, (user_id,))
+                cursor.execute(SQL_DEACTIVATE_PLANS, (user_id,))
             
             try:
                 # Insert workout plan without constraint enforcement
-                cursor.execute("""
-                    INSERT INTO workout_plans (user_id, plan_name, cycle_number, is_active, created_date, notes)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (user_id, plan_name, user.current_cycle_number, True, created_date.isoformat(), notes))
+                cursor.execute(SQL_INSERT_PLAN, (user_id, plan_name, cycle_number, True, created_date.isoformat(), notes))
 
-                plan_id = cursor.lastrowid
-                if plan_id is None:
+                row = cursor.fetchone()
+                if row is None:
                     raise DatabaseError("Failed to create workout plan: no row ID returned")
+                plan_id = row[0]
 
-                # Insert planned exercises
-                for order, exercise_data in enumerate(exercises_list, 1):
-                    cursor.execute("""
-                        INSERT INTO planned_exercises (plan_id, exercise_id, sets, reps, weight, duration, notes, order_in_plan)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
+                # Insert planned exercises in one batch
+                cursor.executemany(SQL_INSERT_PLANNED_EXERCISE, [
+                    (
                         plan_id, exercise_data['exercise_id'], exercise_data['sets'], 
                         exercise_data['reps'], exercise_data.get('weight'), 
                         exercise_data.get('duration'), exercise_data.get('notes'), order
-                    ))
+                    )
+                    for order, exercise_data in enumerate(exercises_list, 1)
+                ])
 
                 return WorkoutPlan(
                     plan_id=plan_id,
                     user_id=user_id,
                     plan_name=plan_name,
-                    cycle_number=user.current_cycle_number,
+                    cycle_number=cycle_number,
                     is_active=True,
                     created_date=created_date,
                     notes=notes
@@ -391,52 +767,44 @@ class Database:
 
     def load_workout_plan(self, user_id: str, plan_id: Optional[int] = None) -> Union[Dict[str, Any], List[WorkoutPlan], None]:
         """Load workout plan(s) for user. Returns single plan if plan_id given, else all active plans."""
-        with self.get_cursor() as cursor:
+        with self.get_reader_cursor() as cursor:
             if plan_id:
-                # Load specific plan
-                cursor.execute("""
-                    SELECT * FROM workout_plans 
-                    WHERE plan_id = ? AND user_id = ?
-                """, (plan_id, user_id))
+                # Load specific plan together with its exercises in one query
+                cursor.execute(SQL_GET_PLAN_WITH_EXERCISES, (plan_id, user_id))
                 
-                row = cursor.fetchone()
-                if not row:
+                rows = cursor.fetchall()
+                if not rows:
                     return None
 
-                # Load exercises for the plan
-                cursor.execute("""
-                    SELECT pe.*, e.name, e.description, e.muscle_groups, e.equipment_needed, e.difficulty_level
-                    FROM planned_exercises pe
-                    JOIN exercises e ON pe.exercise_id = e.exercise_id
-                    WHERE pe.plan_id = ?
-                    ORDER BY pe.order_in_plan
-                """, (plan_id,))
-                
                 exercises = []
-                for ex_row in cursor.fetchall():
+                for ex_row in rows:
+                    if ex_row['planned_exercise_id'] is None:
+                        # Plan without exercises yields a single unmatched row
+                        continue
                     exercises.append({
                         'planned_exercise_id': ex_row['planned_exercise_id'],
                         'exercise_id': ex_row['exercise_id'],
                         'name': ex_row['name'],
                         'description': ex_row['description'],
-                        'muscle_groups': deserialize_json_field(ex_row['muscle_groups']),
-                        'equipment_needed': deserialize_json_field(ex_row['equipment_needed']),
+                        'muscle_groups': _tag_list(ex_row['muscle_groups']),
+                        'equipment_needed': _tag_list(ex_row['equipment_needed']),
                         'difficulty_level': ex_row['difficulty_level'],
                         'sets': ex_row['sets'],
                         'reps': ex_row['reps'],
                         'weight': ex_row['weight'],
                         'duration': ex_row['duration'],
-                        'notes': ex_row['notes'],
+                        'notes': ex_row['exercise_notes'],
                         'order_in_plan': ex_row['order_in_plan']
                     })
 
+                row = rows[0]
                 plan = WorkoutPlan(
                     plan_id=row['plan_id'],
                     user_id=row['user_id'],
                     plan_name=row['plan_name'],
                     cycle_number=row['cycle_number'],
                     is_active=row['is_active'],
-                    created_date=datetime.fromisoformat(row['created_date']),
+                    created_date=parse_timestamp(row['created_date']),
                     notes=row['notes']
                 )
                 
@@ -444,11 +812,7 @@ class Database:
             
             else:
                 # Load all active plans for user
-                cursor.execute("""
-                    SELECT * FROM workout_plans 
-                    WHERE user_id = ? AND is_active = 1
-                    ORDER BY created_date DESC
-                """, (user_id,))
+                cursor.execute(SQL_LIST_ACTIVE_PLANS, (user_id,))
                 
                 plans = []
                 for row in cursor.fetchall():
@@ -458,20 +822,33 @@ class Database:
                         plan_name=row['plan_name'],
                         cycle_number=row['cycle_number'],
                         is_active=row['is_active'],
-                        created_date=datetime.fromisoformat(row['created_date']),
+                        created_date=parse_timestamp(row['created_date']),
                         notes=row['notes']
                     ))
                 
                 return plans
 
+    def load_active_plan_dicts(self, user_id: str) -> List[Dict[str, Any]]:
+        """Load the user's active plans as dicts shaped like WorkoutPlan.to_dict(), skipping the models."""
+        with self.get_reader_cursor() as cursor:
+            cursor.execute(SQL_LIST_ACTIVE_PLANS, (user_id,))
+            return [
+                {
+                    'plan_id': row['plan_id'],
+                    'user_id': row['user_id'],
+                    'plan_name': row['plan_name'],
+                    'cycle_number': row['cycle_number'],
+                    'is_active': row['is_active'],
+                    'created_date': row['created_date'],
+                    'notes': row['notes']
+                }
+                for row in cursor
+            ]
+
     def deactivate_user_plans(self, user_id: str) -> None:
         """Deactivate all active plans for user (used during rotation)."""
-        with self.get_cursor() as cursor:
-            cursor.execute("""
-                UPDATE workout_plans 
-                SET is_active = 0 
-                WHERE user_id = ? AND is_active = 1
-            """, (user_id,))
+        with self._user_write_cursor(user_id) as cursor:
+            cursor.execute(SQL_DEACTIVATE_PLANS, (user_id,))
 
     def start_new_plan_set(self, user_id: str) -> None:
         """Mark the start of a new 3-plan set by deactivating all existing active plans.
@@ -490,14 +867,12 @@ class Database:
             date = datetime.now()
 
         with self.get_cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO personal_records (user_id, exercise_name, record_type, value, unit, date_achieved, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (user_id, exercise_name, record_type, value, unit, date.isoformat(), notes))
+            cursor.execute(SQL_INSERT_PERSONAL_RECORD, (user_id, exercise_name, record_type, value, unit, date.isoformat(), notes))
 
-            record_id = cursor.lastrowid
-            if record_id is None:
+            row = cursor.fetchone()
+            if row is None:
                 raise DatabaseError("Failed to create personal record: no row ID returned")
+            record_id = row[0]
             return PersonalRecord(
                 record_id=record_id,
                 user_id=user_id,
@@ -512,51 +887,82 @@ class Database:
     def load_personal_records(self, user_id: str, exercise_name: Optional[str] = None, 
                              record_type: Optional[str] = None) -> List[PersonalRecord]:
         """Load personal records for user with optional filters."""
-        with self.get_cursor() as cursor:
-            query = "SELECT * FROM personal_records WHERE user_id = ?"
-            params = [user_id]
-
-            if exercise_name:
-                query += " AND exercise_name = ?"
-                params.append(exercise_name)
-
-            if record_type:
-                if not validate_record_type(record_type):
-                    raise ValueError("Invalid record type")
-                query += " AND record_type = ?"
-                params.append(record_type)
-
-            query += " ORDER BY date_achieved DESC"
-
+        return list(self.iter_personal_records(user_id, exercise_name, record_type))
+
+    def load_personal_record_dicts(self, user_id: str, exercise_name: Optional[str] = None,
+                                   record_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Load personal records as dicts shaped like PersonalRecord.to_dict(), skipping the models."""
+        with self.get_reader_cursor() as cursor:
+            query, params = self._personal_record_query(user_id, exercise_name, record_type)
+            cursor.row_factory = None
             cursor.execute(query, params)
-            records = []
-            for row in cursor.fetchall():
-                records.append(PersonalRecord(
-                    record_id=row['record_id'],
-                    user_id=row['user_id'],
-                    exercise_name=row['exercise_name'],
-                    record_type=row['record_type'],
-                    value=row['value'],
-                    unit=row['unit'],
-                    date_achieved=datetime.fromisoformat(row['date_achieved']),
-                    notes=row['notes']
-                ))
-            return records
+            return [
+                {
+                    'record_id': record_id,
+                    'user_id': record_user_id,
+                    'exercise_name': name,
+                    'record_type': kind,
+                    'value': value,
+                    'unit': unit,
+                    'date_achieved': date_achieved,
+                    'notes': notes
+                }
+                for (record_id, record_user_id, name, kind, value, unit, date_achieved, notes) in cursor
+            ]
+
+    def _personal_record_query(self, user_id: str, exercise_name: Optional[str],
+                               record_type: Optional[str]) -> Tuple[str, List[Any]]:
+        """Build the filtered personal record query and its parameters."""
+        query = SQL_SELECT_PERSONAL_RECORDS
+        params = [user_id]
+
+        if exercise_name:
+            query += " AND exercise_name = ?"
+            params.append(exercise_name)
+
+        if record_type:
+            if not validate_record_type(record_type):
+                raise ValueError("Invalid record type")
+            query += " AND record_type = ?"
+            params.append(record_type)
+
+        query += " ORDER BY date_achieved DESC"
+        return query, params
+
+    def iter_personal_records(self, user_id: str, exercise_name: Optional[str] = None,
+                              record_type: Optional[str] = None) -> Iterator[PersonalRecord]:
+        """Yield personal records for user, newest first, as rows are read.
+
+        The reader connection stays checked out until the generator is
+        exhausted or closed, so consume or close it promptly.
+        """
+        with self.get_reader_cursor() as cursor:
+            query, params = self._personal_record_query(user_id, exercise_name, record_type)
+            # Columns are selected in PersonalRecord field order
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            for row in cursor:
+                yield PersonalRecord(*row[:6], date_achieved=parse_timestamp(row[6]), notes=row[7])
 
     def get_active_plan_count(self, user_id: str) -> int:
         """Get count of active plans for user."""
-        with self.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM workout_plans 
-                WHERE user_id = ? AND is_active = 1
-            """, (user_id,))
-            return cursor.fetchone()['count']
+        count = self._active_count_cache.get(user_id)
+        if count is not None:
+            return count
+
+        generation = self._cache_generation
+        with self.get_reader_cursor() as cursor:
+            cursor.execute(SQL_COUNT_ACTIVE_PLANS, (user_id,))
+            count = cursor.fetchone()['count']
+        self._cache_store(self._active_count_cache, user_id, count, generation)
+        return count
 
     def health_check(self) -> bool:
         """Check if database is accessible and healthy."""
         try:
-            with self.get_cursor() as cursor:
-                cursor.execute("SELECT 1")
+            # Reads the schema cookie on a pooled reader: no transaction, no commit
+            with self.get_reader_cursor() as cursor:
+                cursor.execute("PRAGMA schema_version").fetchone()
                 return True
         except Exception:
             return False
\ No newline at end of file
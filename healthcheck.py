@@ -8,10 +8,24 @@ and can be used to verify server and database connectivity.
 
 import sys
 import json
+import sqlite3
 from datetime import datetime
-from database import Database
+from database import Database, DatabaseError
 from config import config
 
+EXPECTED_TABLES = frozenset({'users', 'exercises', 'workout_plans', 'planned_exercises', 'personal_records'})
+
+def _probe_user_write(db):
+    """Create a test user inside a savepoint and roll it back; raises on failure."""
+    with db.get_cursor() as cursor:
+        cursor.execute("SAVEPOINT health_probe")
+        try:
+            test_user_id = f"health_check_{int(datetime.now().timestamp())}"
+            db.create_user(test_user_id, "Health Check User")
+        finally:
+            cursor.execute("ROLLBACK TO health_probe")
+            cursor.execute("RELEASE health_probe")
+
 def health_check():
     """Perform comprehensive health check."""
     health_status = {
@@ -21,15 +35,30 @@ def health_check():
         "details": {}
     }
     
+    db = None
     try:
-        # Database connectivity check
+        run_read_probe = not config.deep_healthcheck
+
+        # Database connectivity, schema and read probes share one pooled reader
+        config.ensure_dirs()
         db = Database(config.database_path)
-        if db.health_check():
+        tables = None
+        read_probe_error = None
+        try:
+            with db.get_reader_cursor() as cursor:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                tables = {row[0] for row in cursor.fetchall()}
+                if run_read_probe:
+                    try:
+                        cursor.execute("SELECT 1 FROM users LIMIT 1")
+                        cursor.fetchone()
+                    except sqlite3.Error as e:
+                        read_probe_error = e
             health_status["checks"]["database"] = "healthy"
             health_status["details"]["database"] = "SQLite database accessible"
-        else:
+        except Exception as e:
             health_status["checks"]["database"] = "unhealthy"
-            health_status["details"]["database"] = "SQLite database not accessible"
+            health_status["details"]["database"] = f"SQLite database not accessible: {str(e)}"
             health_status["status"] = "degraded"
         
         # Configuration validation check
@@ -42,38 +71,34 @@ def health_check():
             health_status["status"] = "unhealthy"
         
         # Database schema check (verify tables exist)
-        try:
-            with db.get_cursor() as cursor:
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = [row[0] for row in cursor.fetchall()]
-                
-                expected_tables = {'users', 'exercises', 'workout_plans', 'planned_exercises', 'personal_records'}
-                missing_tables = expected_tables - set(tables)
-                
-                if not missing_tables:
-                    health_status["checks"]["schema"] = "healthy"
-                    health_status["details"]["schema"] = f"All {len(expected_tables)} tables present"
-                else:
-                    health_status["checks"]["schema"] = "unhealthy"
-                    health_status["details"]["schema"] = f"Missing tables: {missing_tables}"
-                    health_status["status"] = "unhealthy"
-        
-        except Exception as e:
+        if tables is None:
             health_status["checks"]["schema"] = "unhealthy"
-            health_status["details"]["schema"] = f"Schema check failed: {str(e)}"
+            health_status["details"]["schema"] = "Schema check failed: database not accessible"
             health_status["status"] = "unhealthy"
+        else:
+            missing_tables = EXPECTED_TABLES - tables
+            if not missing_tables:
+                health_status["checks"]["schema"] = "healthy"
+                health_status["details"]["schema"] = f"All {len(EXPECTED_TABLES)} tables present"
+            else:
+                health_status["checks"]["schema"] = "unhealthy"
+                health_status["details"]["schema"] = f"Missing tables: {set(missing_tables)}"
+                health_status["status"] = "unhealthy"
         
-        # Basic functionality check (can create test user)
+        # Basic functionality check (can read users; with DEEP_HEALTHCHECK also
+        # create one inside a savepoint that is rolled back, so nothing persists)
         try:
-            test_user_id = f"health_check_{int(datetime.now().timestamp())}"
-            user = db.create_user(test_user_id, "Health Check User")
-            if user:
-                health_status["checks"]["basic_operations"] = "healthy"
-                health_status["details"]["basic_operations"] = "Can create and retrieve users"
+            if config.deep_healthcheck:
+                _probe_user_write(db)
+                detail = "Can create and retrieve users (rolled back)"
             else:
-                health_status["checks"]["basic_operations"] = "unhealthy"
-                health_status["details"]["basic_operations"] = "Cannot create users"
-                health_status["status"] = "degraded"
+                if tables is None:
+                    raise DatabaseError("database not accessible")
+                if read_probe_error is not None:
+                    raise read_probe_error
+                detail = "Can query users"
+            health_status["checks"]["basic_operations"] = "healthy"
+            health_status["details"]["basic_operations"] = detail
         except Exception as e:
             health_status["checks"]["basic_operations"] = "unhealthy"
             health_status["details"]["basic_operations"] = f"Basic operations failed: {str(e)}"
@@ -96,6 +121,9 @@ def health_check():
         health_status["status"] = "unhealthy"
         health_status["checks"]["system"] = "unhealthy"
         health_status["details"]["system_error"] = str(e)
+    finally:
+        if db is not None:
+            db.close()
     
     return health_status
 
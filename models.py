@@ -10,8 +10,14 @@ from typing import List, Optional, Union
 from datetime import datetime
 import json
 
+# Bound once so to_dict skips the per-call attribute lookup on datetime instances
+_ISO = datetime.isoformat
+# Prebound codec methods skip json.dumps/json.loads argument handling per call
+_encode_json = json.JSONEncoder().encode
+_decode_json = json.JSONDecoder().decode
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
     """User model with rotation settings."""
     user_id: str
@@ -26,14 +32,14 @@ class User:
         return {
             'user_id': self.user_id,
             'name': self.name,
-            'created_date': self.created_date.isoformat(),
+            'created_date': _ISO(self.created_date),
             'rotation_weeks': self.rotation_weeks,
-            'last_rotation_date': self.last_rotation_date.isoformat() if self.last_rotation_date else None,
+            'last_rotation_date': _ISO(self.last_rotation_date) if self.last_rotation_date else None,
             'current_cycle_number': self.current_cycle_number
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Exercise:
     """Exercise model with metadata."""
     exercise_id: int
@@ -56,12 +62,12 @@ class Exercise:
             'equipment_needed': self.equipment_needed,
             'difficulty_level': self.difficulty_level,
             'instructions': self.instructions,
-            'created_date': self.created_date.isoformat(),
+            'created_date': _ISO(self.created_date),
             'created_by_user_id': self.created_by_user_id
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutPlan:
     """Workout plan model with 3-plan constraint support."""
     plan_id: int
@@ -80,12 +86,12 @@ class WorkoutPlan:
             'plan_name': self.plan_name,
             'cycle_number': self.cycle_number,
             'is_active': self.is_active,
-            'created_date': self.created_date.isoformat(),
+            'created_date': _ISO(self.created_date),
             'notes': self.notes
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlannedExercise:
     """Planned exercise model for exercises within workout plans."""
     planned_exercise_id: int
@@ -113,7 +119,7 @@ class PlannedExercise:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonalRecord:
     """Personal record model for tracking user PRs."""
     record_id: int
@@ -134,7 +140,7 @@ class PersonalRecord:
             'record_type': self.record_type,
             'value': self.value,
             'unit': self.unit,
-            'date_achieved': self.date_achieved.isoformat(),
+            'date_achieved': _ISO(self.date_achieved),
             'notes': self.notes
         }
 
@@ -144,6 +150,8 @@ ExerciseFilter = dict
 WorkoutPlanWithExercises = dict
 PersonalRecordFilter = dict
 
+VALID_RECORD_TYPES = frozenset({'weight', 'reps', 'time', 'distance'})
+
 
 def validate_difficulty_level(difficulty: int) -> bool:
     """Validate difficulty level is within 1-5 range."""
@@ -152,18 +160,22 @@ def validate_difficulty_level(difficulty: int) -> bool:
 
 def validate_record_type(record_type: str) -> bool:
     """Validate record type is one of the allowed types."""
-    valid_types = {'weight', 'reps', 'time', 'distance'}
-    return record_type.lower() in valid_types
+    return record_type.lower() in VALID_RECORD_TYPES
 
 
 def serialize_json_field(data: Union[List[str], dict]) -> str:
     """Serialize Python data structures to JSON string for database storage."""
-    return json.dumps(data)
+    return _encode_json(data)
 
 
 def deserialize_json_field(json_str: str) -> Union[List[str], dict]:
     """Deserialize JSON string from database to Python data structures."""
+    # Empty containers and NULL/blank columns are common and need no parser
+    if not json_str or json_str == '[]':
+        return []
+    if json_str == '{}':
+        return {}
     try:
-        return json.loads(json_str)
+        return _decode_json(json_str)
     except (json.JSONDecodeError, TypeError):
         return []
\ No newline at end of file
@@ -8,6 +8,32 @@ import requests
 import time
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session():
+    """Create a session whose connection pool keeps the server socket warm between checks"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+SESSION = create_session()
+
+SSE_HEADERS = {"Accept": "text/event-stream"}
+JSON_HEADERS = {"Content-Type": "application/json"}
+# The server pings the SSE stream every 30 s, so a read timeout of a few
+# missed pings means the connection is dead
+SSE_TIMEOUT = (3.05, 75)
+# Reconnect delay is 2 ** failures seconds, capped at MAX_BACKOFF; a stream
+# that stayed up for at least one ping interval resets the failure count
+MAX_BACKOFF = 60  # seconds
+STABLE_STREAM_SECONDS = 30
 
 def monitor_railway_logs(app_url):
     """Monitor the Railway server for incoming requests from Claude.ai"""
@@ -24,7 +50,7 @@ def monitor_railway_logs(app_url):
     
     # Test connectivity first
     try:
-        response = requests.get(f"{app_url}/health")
+        response = SESSION.get(f"{app_url}/health")
         if response.status_code == 200:
             print("✅ Server is accessible and healthy")
         else:
@@ -34,49 +60,124 @@ def monitor_railway_logs(app_url):
         print(f"❌ Cannot reach server: {e}")
         return
     
-    # Monitor by making periodic health checks and looking for activity
+    # Subscribe to the server's SSE stream and report events as they arrive;
+    # /health is only probed when the stream drops
     print(f"\n🔄 Monitoring started at {datetime.now()}")
     print("Make requests in Claude.ai now...")
     
-    last_check = time.time()
-    check_count = 0
+    event_count = 0
+    failures = 0
     
-    while True:
-        try:
-            check_count += 1
-            current_time = datetime.now().strftime("%H:%M:%S")
-            
-            # Make a health check to verify server is still up
-            response = requests.get(f"{app_url}/health", timeout=10)
-            
-            if response.status_code == 200:
-                print(f"[{current_time}] Check #{check_count}: Server responding ✅")
-            else:
-                print(f"[{current_time}] Check #{check_count}: Server error {response.status_code} ❌")
-            
-            # Test if MCP endpoints are working
-            if check_count % 5 == 0:  # Every 5th check, test MCP
-                try:
-                    mcp_test = requests.post(f"{app_url}/", 
-                        json={"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}},
-                        timeout=10)
-                    if mcp_test.status_code == 200:
-                        result = mcp_test.json()
-                        tool_count = len(result.get('result', {}).get('tools', []))
-                        print(f"[{current_time}] MCP Test: {tool_count} tools available ✅")
+    try:
+        while True:
+            connected_at = None
+            try:
+                with SESSION.get(f"{app_url}/", headers=SSE_HEADERS, stream=True, timeout=SSE_TIMEOUT) as response:
+                    current_time = datetime.now().strftime("%H:%M:%S")
+                    if response.status_code == 200:
+                        connected_at = time.monotonic()
+                        print(f"[{current_time}] SSE stream connected ✅")
+                        for line in response.iter_lines(decode_unicode=True):
+                            if line and line.startswith("data:"):
+                                event_count += 1
+                                current_time = datetime.now().strftime("%H:%M:%S")
+                                print(f"[{current_time}] Event #{event_count}: {line[5:].strip()}")
+                        print(f"[{datetime.now().strftime('%H:%M:%S')}] SSE stream closed by server ❌")
                     else:
-                        print(f"[{current_time}] MCP Test: Failed {mcp_test.status_code} ❌")
-                except Exception as e:
-                    print(f"[{current_time}] MCP Test: Error {str(e)} ❌")
+                        print(f"[{current_time}] SSE stream failed {response.status_code} ❌")
+            except Exception as e:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] SSE stream error: {e}")
             
-            time.sleep(10)  # Check every 10 seconds
+            # Stream dropped: check whether the server itself is still up before reconnecting
+            current_time = datetime.now().strftime("%H:%M:%S")
+            try:
+                response = SESSION.get(f"{app_url}/health", timeout=10)
+                if response.status_code == 200:
+                    print(f"[{current_time}] Health check: Server responding ✅")
+                else:
+                    print(f"[{current_time}] Health check: Server error {response.status_code} ❌")
+            except Exception as e:
+                print(f"[{current_time}] Health check: Error {str(e)} ❌")
             
-        except KeyboardInterrupt:
-            print(f"\n\n🛑 Monitoring stopped by user at {datetime.now()}")
-            break
-        except Exception as e:
-            print(f"[{current_time}] Monitoring error: {e}")
-            time.sleep(5)
+            if connected_at is not None and time.monotonic() - connected_at >= STABLE_STREAM_SECONDS:
+                failures = 0
+            else:
+                failures += 1
+            delay = min(MAX_BACKOFF, 2 ** failures)
+            print(f"[{current_time}] Reconnecting in {delay}s")
+            time.sleep(delay)
+    
+    except KeyboardInterrupt:
+        print(f"\n\n🛑 Monitoring stopped by user at {datetime.now()}")
+
+def _json_body(data):
+    """Serialize a request body once so repeated runs send the same bytes"""
+    return json.dumps(data).encode()
+
+
+# Scenarios Claude.ai walks through when connecting; bodies are serialized at import
+SCENARIOS = [
+    {
+        "name": "Client Registration (what Claude.ai does first)",
+        "method": "POST",
+        "endpoint": "/register",
+        "body": _json_body({
+            "client_name": "Claude.ai Remote MCP",
+            "grant_types": ["client_credentials"],
+            "response_types": ["token"],
+            "redirect_uris": ["https://claude.ai/mcp/callback"]
+        })
+    },
+    {
+        "name": "MCP Initialize (what Claude.ai does second)",
+        "method": "POST", 
+        "endpoint": "/",
+        "body": _json_body({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {"tools": {}},
+                "clientInfo": {"name": "Claude.ai", "version": "1.0"}
+            }
+        })
+    },
+    {
+        "name": "Tools Discovery (what Claude.ai does third)",
+        "method": "POST",
+        "endpoint": "/",
+        "body": _json_body({
+            "jsonrpc": "2.0",
+            "id": 2, 
+            "method": "tools/list",
+            "params": {}
+        })
+    },
+    {
+        "name": "SSE Stream Setup (what Claude.ai might do)",
+        "method": "GET",
+        "endpoint": "/",
+        "headers": {"Accept": "text/event-stream"}
+    }
+]
+
+def run_scenario(app_url, scenario):
+    """Send one scenario request, returning the response or the exception raised"""
+    try:
+        url = f"{app_url}{scenario['endpoint']}"
+        if scenario['method'] == 'POST':
+            return SESSION.post(url, data=scenario['body'], headers=JSON_HEADERS, timeout=10)
+        
+        response = SESSION.get(url, headers=scenario.get('headers'), timeout=5, stream=True)
+        if 'event-stream' in response.headers.get('content-type', ''):
+            # Only the headers are inspected; release the pooled connection
+            response.close()
+        else:
+            response.content  # read the body before leaving the worker thread
+        return response
+    except Exception as e:
+        return e
 
 def test_claude_scenarios(app_url):
     """Test scenarios that Claude.ai might use"""
@@ -86,65 +187,19 @@ def test_claude_scenarios(app_url):
     print(f"🧪 Testing Claude.ai scenarios on: {app_url}")
     print("=" * 60)
     
-    scenarios = [
-        {
-            "name": "Client Registration (what Claude.ai does first)",
-            "method": "POST",
-            "endpoint": "/register",
-            "data": {
-                "client_name": "Claude.ai Remote MCP",
-                "grant_types": ["client_credentials"],
-                "response_types": ["token"],
-                "redirect_uris": ["https://claude.ai/mcp/callback"]
-            }
-        },
-        {
-            "name": "MCP Initialize (what Claude.ai does second)",
-            "method": "POST", 
-            "endpoint": "/",
-            "data": {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {"tools": {}},
-                    "clientInfo": {"name": "Claude.ai", "version": "1.0"}
-                }
-            }
-        },
-        {
-            "name": "Tools Discovery (what Claude.ai does third)",
-            "method": "POST",
-            "endpoint": "/",
-            "data": {
-                "jsonrpc": "2.0",
-                "id": 2, 
-                "method": "tools/list",
-                "params": {}
-            }
-        },
-        {
-            "name": "SSE Stream Setup (what Claude.ai might do)",
-            "method": "GET",
-            "endpoint": "/",
-            "headers": {"Accept": "text/event-stream"}
-        }
-    ]
-    
-    for i, scenario in enumerate(scenarios, 1):
+    
+    # Scenarios are independent probes, so send them concurrently and
+    # report the results in order afterwards
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda scenario: run_scenario(app_url, scenario), SCENARIOS))
+    
+    for i, (scenario, response) in enumerate(zip(SCENARIOS, results), 1):
         print(f"\n{i}. {scenario['name']}")
         print("-" * 40)
         
         try:
-            url = f"{app_url}{scenario['endpoint']}"
-            headers = scenario.get('headers', {})
-            
-            if scenario['method'] == 'POST':
-                headers['Content-Type'] = 'application/json'
-                response = requests.post(url, json=scenario['data'], headers=headers, timeout=10)
-            elif scenario['method'] == 'GET':
-                response = requests.get(url, headers=headers, timeout=5, stream=True)
+            if isinstance(response, Exception):
+                raise response
             
             print(f"Status: {response.status_code}")
             print(f"Headers: {dict(response.headers)}")
@@ -153,7 +208,7 @@ def test_claude_scenarios(app_url):
                 print("Response: SSE stream opened successfully ✅")
             else:
                 try:
-                    result = response.json()
+                    result = json.loads(response.content)
                     if 'tools' in str(result):
                         tool_count = len(result.get('result', {}).get('tools', []))
                         print(f"Response: Found {tool_count} MCP tools ✅")
@@ -8,20 +8,17 @@ to ensure everything is working according to specifications.
 
 import os
 import sqlite3
+import tempfile
 from datetime import datetime
-from database import Database, DatabaseError
+from database import Database, DatabaseError, SCHEMA_VERSION
 from models import User, Exercise, WorkoutPlan
 
 def test_database_schema():
     """Test database schema creation and constraints."""
     print("Testing AmaCoach Database Schema...")
     
-    # Use test database
-    test_db_path = "test_amacoach.db"
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
-    
-    db = Database(test_db_path)
+    # Use a fresh in-memory database: no file to clean up and no fsyncs per write
+    db = Database(":memory:")
     
     # Test 1: Create test user
     print("\n1. Testing User Creation...")
@@ -223,11 +220,213 @@ def test_database_schema():
     print("✅ Plan rotation system is operational")
     print("="*50)
     
-    # Cleanup
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
-        print("🧹 Test database cleaned up")
+    db.close()
+
+
+def test_schema_migration():
+    """Test upgrading a pre-tag-table database and the tag filters it backfills."""
+    print("Testing AmaCoach Schema Migration...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "legacy.db")
+        
+        # Build a database the way the original schema left it: tags only in
+        # the JSON columns, no tag tables and user_version 0
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE users (
+                user_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                created_date TEXT NOT NULL,
+                rotation_weeks INTEGER DEFAULT 6,
+                last_rotation_date TEXT,
+                current_cycle_number INTEGER DEFAULT 1
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE exercises (
+                exercise_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                description TEXT NOT NULL,
+                muscle_groups TEXT NOT NULL,
+                equipment_needed TEXT NOT NULL,
+                difficulty_level INTEGER NOT NULL,
+                instructions TEXT NOT NULL,
+                created_date TEXT NOT NULL,
+                created_by_user_id TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX idx_exercises_muscle_groups ON exercises (muscle_groups)")
+        now = datetime.now().isoformat()
+        conn.execute("INSERT INTO users (user_id, name, created_date) VALUES (?, ?, ?)",
+                     ("legacy_user", "Legacy User", now))
+        legacy_exercises = [
+            ("Bench Press", '["Chest", "triceps"]', '["Barbell", "bench"]'),
+            ("Good Morning", '["lower back", "hamstrings"]', '["barbell"]'),
+            ("Plank", '["core"]', '[]'),
+            ("Broken Tags", 'not json', '{"equipment": "none"}'),
+        ]
+        conn.executemany("""
+            INSERT INTO exercises (name, description, muscle_groups, equipment_needed,
+                                   difficulty_level, instructions, created_date, created_by_user_id)
+            VALUES (?, 'legacy', ?, ?, 2, 'legacy', ?, 'legacy_user')
+        """, [(name, muscles, equipment, now) for name, muscles, equipment in legacy_exercises])
+        conn.commit()
+        
+        # Test 1: Opening the database migrates it
+        print("\n1. Testing Schema Upgrade...")
+        db = Database(db_path)
+        with db.get_reader_cursor() as cursor:
+            cursor.execute("PRAGMA user_version")
+            assert cursor.fetchone()[0] == SCHEMA_VERSION
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_exercises_muscle_groups'")
+            assert cursor.fetchone() is None
+        print("✓ user_version bumped and obsolete index dropped")
+        
+        # Test 2: Tag tables are backfilled from the JSON columns
+        print("\n2. Testing Tag Backfill...")
+        with db.get_reader_cursor() as cursor:
+            cursor.execute("""
+                SELECT e.name, m.muscle_group FROM exercise_muscle_groups m
+                JOIN exercises e USING (exercise_id) ORDER BY e.name, m.muscle_group
+            """)
+            muscle_rows = [tuple(row) for row in cursor.fetchall()]
+            cursor.execute("""
+                SELECT e.name, q.equipment FROM exercise_equipment q
+                JOIN exercises e USING (exercise_id) ORDER BY e.name, q.equipment
+            """)
+            equipment_rows = [tuple(row) for row in cursor.fetchall()]
+        assert muscle_rows == [
+            ("Bench Press", "Chest"), ("Bench Press", "triceps"),
+            ("Good Morning", "hamstrings"), ("Good Morning", "lower back"),
+            ("Plank", "core"),
+        ], muscle_rows
+        assert equipment_rows == [
+            ("Bench Press", "Barbell"), ("Bench Press", "bench"),
+            ("Good Morning", "barbell"),
+        ], equipment_rows
+        print("✓ Tag tables backfilled, malformed tags skipped")
+        
+        # Test 3: Tag filters match the original LIKE-based filters
+        print("\n3. Testing Tag Filters Against LIKE Filters...")
+        probes = {
+            ("muscle_groups", "muscle_group"): ["chest", "CHEST", "Triceps", "back", "lower back", "core", "legs"],
+            ("equipment_needed", "equipment"): ["barbell", "BARBELL", "Bench", "bar"],
+        }
+        for (column, argument), values in probes.items():
+            for value in values:
+                with db.get_reader_cursor() as cursor:
+                    cursor.execute(f"SELECT name FROM exercises WHERE {column} LIKE ? ORDER BY name",
+                                   (f'%"{value}"%',))
+                    expected = [row[0] for row in cursor.fetchall()]
+                actual = [exercise.name for exercise in db.list_exercises(**{argument: value})]
+                assert actual == expected, (argument, value, actual, expected)
+        # A tag column that is not an array has no tags, even though LIKE matched inside it
+        assert db.list_exercises(equipment="none") == []
+        print("✓ Tag filters return the same exercises as the LIKE filters")
+        
+        # Test 4: Reopening a migrated database keeps the data as is
+        print("\n4. Testing Reopen After Migration...")
+        db.close()
+        db = Database(db_path)
+        assert [exercise.name for exercise in db.list_exercises(muscle_group="chest")] == ["Bench Press"]
+        assert len(db.list_exercises(equipment="barbell")) == 2
+        print("✓ Migrated database reopens without changes")
+        db.close()
+    
+    print("\n✅ Schema migration is working correctly")
+
+
+def test_reader_pool():
+    """Test the WAL reader pool of a file-backed database."""
+    print("Testing AmaCoach Reader Pool...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(os.path.join(tmp_dir, "pool.db"), reader_pool_size=2)
+        
+        # Test 1: File databases run in WAL mode on separate reader connections
+        print("\n1. Testing WAL Reader Connections...")
+        with db.get_reader_cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            assert cursor.fetchone()[0] == "wal"
+            first_reader = cursor.connection
+        assert first_reader is not db.get_connection()
+        print("✓ Reads use a pooled WAL connection, not the writer")
+        
+        # Test 2: Readers are reused most-recently-returned first
+        print("\n2. Testing Reader Reuse...")
+        with db.get_reader_cursor() as cursor:
+            assert cursor.connection is first_reader
+            with db.get_reader_cursor() as nested:
+                second_reader = nested.connection
+                assert second_reader is not first_reader
+        with db.get_reader_cursor() as cursor:
+            assert cursor.connection is first_reader
+        print("✓ Pool reuses the most recently returned reader")
+        
+        # Test 3: Committed writes are visible to the pooled readers
+        print("\n3. Testing Read-After-Write Visibility...")
+        db.create_user("pool_user", "Pool User")
+        exercise = db.create_exercise("Lunge", "Single-leg exercise", ["quadriceps"], ["bodyweight"],
+                                      2, "Step forward and lower", "pool_user")
+        with db.get_reader_cursor() as cursor:
+            assert cursor.connection is first_reader
+            cursor.execute("SELECT name FROM exercises WHERE exercise_id = ?", (exercise.exercise_id,))
+            assert cursor.fetchone()[0] == "Lunge"
+        assert [e.name for e in db.list_exercises(muscle_group="quadriceps")] == ["Lunge"]
+        plan = db.save_workout_plan("pool_user", "Legs", [{"exercise_id": exercise.exercise_id, "sets": 3, "reps": 10}])
+        assert db.load_workout_plan("pool_user", plan.plan_id)['plan']['plan_name'] == "Legs"
+        print("✓ Readers see writes committed by the writer connection")
+        
+        # Test 4: Reads inside a write transaction see its uncommitted changes
+        print("\n4. Testing Reads Inside a Write Transaction...")
+        with db.get_cursor() as cursor:
+            cursor.execute("UPDATE users SET name = 'Renamed' WHERE user_id = 'pool_user'")
+            with db.get_reader_cursor() as reader:
+                assert reader.connection is db.get_connection()
+                reader.execute("SELECT name FROM users WHERE user_id = 'pool_user'")
+                assert reader.fetchone()[0] == "Renamed"
+        print("✓ Reads inside a write transaction use the writer")
+        
+        db.close()
+    
+    print("\n✅ Reader pool is working correctly")
+
+
+def test_user_cache_invalidation():
+    """Test that cached user reads are refreshed by writes."""
+    print("Testing AmaCoach User Cache Invalidation...")
+    
+    db = Database(":memory:")
+    db.create_user("cache_user", "Cache User")
+    exercise = db.create_exercise("Row", "Horizontal pull", ["back"], ["dumbbell"], 2,
+                                  "Pull the weight to your hip", "cache_user")
+    
+    # Test 1: get_user is served from the cache until the user is written
+    print("\n1. Testing get_user Cache...")
+    assert db.get_user("cache_user").current_cycle_number == 1
+    cached_user = db.get_user("cache_user")
+    cached_user.current_cycle_number = 99
+    assert db.get_user("cache_user").current_cycle_number == 1
+    db.update_user_rotation("cache_user")
+    assert db.get_user("cache_user").current_cycle_number == 2
+    print("✓ Cached user is copied and refreshed by rotation")
+    
+    # Test 2: Active plan counts follow plan saves and deactivation
+    print("\n2. Testing Active Plan Count Cache...")
+    assert db.get_active_plan_count("cache_user") == 0
+    db.save_workout_plan("cache_user", "Pull Day", [{"exercise_id": exercise.exercise_id, "sets": 3, "reps": 10}])
+    assert db.get_active_plan_count("cache_user") == 1
+    db.deactivate_user_plans("cache_user")
+    assert db.get_active_plan_count("cache_user") == 0
+    print("✓ Plan writes refresh the cached active plan count")
+    
+    db.close()
+    print("\n✅ User cache invalidation is working correctly")
 
 
 if __name__ == "__main__":
+    test_schema_migration()
+    test_reader_pool()
+    test_user_cache_invalidation()
     test_database_schema()
\ No newline at end of file
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Server response cache verification script for AmaCoach.
+
+This script checks that the cached list_exercises, load_personal_records and
+generate_workout_guidance responses are refreshed by the tools that write.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+
+# The server opens its database at import, so point it at a scratch file first
+_tmp_dir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_PATH"] = os.path.join(_tmp_dir.name, "test_server.db")
+
+import server
+
+
+class _Context:
+    """Minimal request context carrying a user_id."""
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+
+
+def call_tool(name, arguments, user_id="cache_user"):
+    """Call a tool and decode its JSON response."""
+    result = asyncio.run(server.handle_call_tool(name, arguments, _Context(user_id)))
+    return json.loads(result[0].text)
+
+
+def create_exercise(name, muscle_groups, equipment_needed):
+    """Create an exercise through the create_exercise tool."""
+    return call_tool("create_exercise", {
+        "name": name,
+        "description": f"{name} description",
+        "muscle_groups": muscle_groups,
+        "equipment_needed": equipment_needed,
+        "difficulty_level": 2,
+        "instructions": f"Perform the {name}"
+    })
+
+
+def guidance_exercise_names(**arguments):
+    """Return the exercise names listed by generate_workout_guidance."""
+    guidance = call_tool("generate_workout_guidance", {"user_id": "cache_user", **arguments})
+    return sorted(exercise["name"] for exercise in guidance["guidance"]["available_exercises"]["exercises"])
+
+
+def test_response_cache_invalidation():
+    """Test that cached tool responses are refreshed by writes."""
+    print("Testing AmaCoach Response Cache Invalidation...")
+
+    # Test 1: list_exercises picks up newly created exercises
+    print("\n1. Testing list_exercises Cache...")
+    create_exercise("Goblet Squat", ["quadriceps", "glutes"], ["dumbbell"])
+    assert call_tool("list_exercises", {})["count"] == 1
+    assert call_tool("list_exercises", {"muscle_group": "glutes"})["count"] == 1
+    create_exercise("Hip Thrust", ["glutes"], ["barbell"])
+    assert call_tool("list_exercises", {})["count"] == 2
+    assert call_tool("list_exercises", {"muscle_group": "glutes"})["count"] == 2
+    print("✓ Creating an exercise refreshes cached listings")
+
+    # Test 2: Guidance exercise lists follow new exercises too
+    print("\n2. Testing Guidance Exercise Cache...")
+    assert guidance_exercise_names(equipment_available=["barbell"]) == ["Hip Thrust"]
+    create_exercise("Barbell Row", ["back"], ["barbell"])
+    assert guidance_exercise_names(equipment_available=["barbell"]) == ["Barbell Row", "Hip Thrust"]
+    print("✓ Creating an exercise refreshes cached guidance lists")
+
+    # Test 3: Personal records are refreshed per user
+    print("\n3. Testing load_personal_records Cache...")
+    assert call_tool("load_personal_records", {})["count"] == 0
+    assert call_tool("load_personal_records", {}, user_id="other_user")["count"] == 0
+    call_tool("save_personal_record", {
+        "exercise_name": "Hip Thrust", "record_type": "weight", "value": 140, "unit": "kg"
+    })
+    assert call_tool("load_personal_records", {})["count"] == 1
+    assert call_tool("load_personal_records", {"record_type": "weight"})["count"] == 1
+    assert call_tool("load_personal_records", {}, user_id="other_user")["count"] == 0
+    print("✓ Saving a record refreshes only that user's cached records")
+
+    print("\n✅ Response cache invalidation is working correctly")
+
+
+if __name__ == "__main__":
+    try:
+        test_response_cache_invalidation()
+    finally:
+        server.db.close()
+        _tmp_dir.cleanup()